@@ -1,6 +1,7 @@
 import React, { useState } from 'react';
 import { Link, useLocation } from 'react-router-dom';
 import { FaBars, FaTimes, FaHome, FaBuilding, FaFutbol, FaInfoCircle, FaPhone } from 'react-icons/fa';
+import { prefetchRoute } from '../services/api';
 
 const Navbar = () => {
   const [isOpen, setIsOpen] = useState(false);
@@ -39,6 +40,7 @@ const Navbar = () => {
                 <Link
                   key={item.name}
                   to={item.href}
+                  onMouseEnter={() => prefetchRoute(item.href)}
                   className={`flex items-center space-x-2 px-3 py-2 rounded-lg transition-colors duration-200 ${
                     isActive(item.href)
                       ? 'bg-primary-600 text-white'
@@ -71,6 +73,7 @@ const Navbar = () => {
                   key={item.name}
                   to={item.href}
                   onClick={() => setIsOpen(false)}
+                  onTouchStart={() => prefetchRoute(item.href)}
                   className={`flex items-center space-x-3 px-4 py-3 rounded-lg transition-colors duration-200 ${
                     isActive(item.href)
                       ? 'bg-primary-600 text-white'
@@ -9,25 +9,118 @@ const api = axios.create({
   },
 });
 
+// Query cache
+// Bump CACHE_VERSION whenever the shape of an API response changes so that
+// data persisted by an older build is discarded instead of rendered.
+const CACHE_VERSION = 1;
+const STORAGE_KEY = 'relish-api-cache';
+const STALE_TIME = 60 * 1000; // Serve without refetching for 1 minute
+const MAX_AGE = 24 * 60 * 60 * 1000; // Drop persisted entries after 1 day
+
+const cache = new Map(); // url -> { data, updatedAt }
+const inFlight = new Map(); // url -> Promise
+
+const loadPersistedCache = () => {
+  try {
+    const stored = JSON.parse(window.localStorage.getItem(STORAGE_KEY));
+    if (!stored || stored.version !== CACHE_VERSION) {
+      window.localStorage.removeItem(STORAGE_KEY);
+      return;
+    }
+    const now = Date.now();
+    Object.entries(stored.entries || {}).forEach(([url, entry]) => {
+      if (now - entry.updatedAt < MAX_AGE) {
+        cache.set(url, entry);
+      }
+    });
+  } catch (error) {
+    // Storage unavailable or corrupt - start with an empty cache
+  }
+};
+
+const persistCache = () => {
+  try {
+    window.localStorage.setItem(STORAGE_KEY, JSON.stringify({
+      version: CACHE_VERSION,
+      entries: Object.fromEntries(cache),
+    }));
+  } catch (error) {
+    // Storage full or unavailable - the in-memory cache still works
+  }
+};
+
+const fetchQuery = (url) => {
+  // Share a single request between every caller asking for the same url
+  if (!inFlight.has(url)) {
+    const request = api.get(url)
+      .then((response) => {
+        cache.set(url, { data: response.data, updatedAt: Date.now() });
+        persistCache();
+        return { data: response.data };
+      })
+      .finally(() => {
+        inFlight.delete(url);
+      });
+    inFlight.set(url, request);
+  }
+  return inFlight.get(url);
+};
+
+// Resolves with `{ data }` like an axios response. Fresh entries are returned
+// as-is; stale entries are returned immediately and revalidated in the background.
+const cachedGet = (url) => {
+  const entry = cache.get(url);
+  if (!entry) {
+    return fetchQuery(url);
+  }
+  if (Date.now() - entry.updatedAt > STALE_TIME) {
+    fetchQuery(url).catch((error) => {
+      console.error(`Error revalidating ${url}:`, error);
+    });
+  }
+  return Promise.resolve({ data: entry.data });
+};
+
+loadPersistedCache();
+
 export const apiService = {
   // Health check
   healthCheck: () => api.get('/api/health'),
 
   // Sports
-  getSports: () => api.get('/api/sports'),
-  
+  getSports: () => cachedGet('/api/sports'),
+
   // Facilities
-  getFacilities: () => api.get('/api/facilities'),
-  
+  getFacilities: () => cachedGet('/api/facilities'),
+
   // Coaches
-  getCoaches: () => api.get('/api/coaches'),
-  
+  getCoaches: () => cachedGet('/api/coaches'),
+
   // Branches
-  getBranches: () => api.get('/api/branches'),
-  
+  getBranches: () => cachedGet('/api/branches'),
+
   // Contact
   submitContactForm: (data) => api.post('/api/contact', data),
   getContactForms: () => api.get('/api/contact-forms'),
 };
 
-export default api;
\ No newline at end of file
+// Data each route loads on mount, used to warm the cache on link hover
+const routeQueries = {
+  '/': [apiService.getSports, apiService.getFacilities],
+  '/facilities': [apiService.getFacilities, apiService.getBranches],
+  '/sports': [apiService.getSports],
+  '/about': [apiService.getCoaches],
+};
+
+export const prefetchRoute = (path) => {
+  const queries = path.startsWith('/sports/')
+    ? [apiService.getSports]
+    : routeQueries[path] || [];
+  queries.forEach((query) => {
+    query().catch(() => {
+      // Prefetch failures are ignored; the page will retry on mount
+    });
+  });
+};
+
+export default api;